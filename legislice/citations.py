@@ -2,6 +2,7 @@
 
 from datetime import date
 from enum import IntEnum
+from functools import lru_cache
 import json
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -33,6 +34,7 @@ KNOWN_CODES: Dict[str, Dict[str, Tuple[str, CodeLevel]]] = {
 }
 
 
+@lru_cache(maxsize=256)
 def identify_code(jurisdiction: str, code: str) -> Tuple[str, str]:
     """Find code name and type based on USLM citation parts."""
     try:
@@ -1,9 +1,18 @@
 """Download Enactments from API, with client."""
 
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-from typing import Any, Dict, List, Mapping, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads_json
+except ImportError:
+    from json import loads as _loads_json
 
 from legislice.enactments import (
     Enactment,
@@ -48,11 +57,28 @@ class LegisliceTokenError(Exception):
     pass
 
 
+def parse_json(response: requests.Response) -> Any:
+    """Decode the JSON body of an API response, using orjson when it's installed."""
+    return _loads_json(response.content)
+
+
+@lru_cache(maxsize=1024)
 def normalize_path(path: str) -> str:
     """Make sure path starts but does not end with a slash."""
     return "/" + path.strip("/")
 
 
+@lru_cache(maxsize=1024)
+def _build_url(api_root: str, path: str, date: str) -> str:
+    """Join API root, normalized path, and ISO date string into an API URL."""
+    query_with_root = api_root + normalize_path(path)
+    if date:
+        return f"{query_with_root}@{date}"
+    if not query_with_root.endswith("/"):
+        query_with_root += "/"
+    return query_with_root
+
+
 class Client:
     """Downloader for legislative text."""
 
@@ -75,6 +101,41 @@ class Client:
             }
         }
         self.update_coverage_from_api = update_coverage_from_api
+        self._session = self._make_session()
+        self._response_cache: Dict[str, requests.Response] = {}
+
+    @staticmethod
+    def _make_session() -> requests.Session:
+        """Make an HTTP session that reuses connections and retries gateway errors."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def clear_cache(self) -> None:
+        """Forget the responses saved by :meth:`warm`."""
+        self._response_cache.clear()
+
+    def close(self) -> None:
+        """Close the Client's HTTP connections and clear its response cache."""
+        self.clear_cache()
+        self._session.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def fetch(
         self,
@@ -103,6 +164,107 @@ class Client:
             return self.fetch_inbound_reference(query=query)
         return self.fetch_uri(query=query, date=date)
 
+    def fetch_batch(
+        self,
+        queries: Sequence[
+            Union[str, CitingProvisionLocation, CrossReference, InboundReference]
+        ],
+        date: Union[datetime.date, str] = "",
+        max_workers: int = 4,
+    ) -> List[RawEnactment]:
+        """
+        Download several legislative provisions, in the same order as the queries.
+
+        The downloads run concurrently in a pool of threads, so the total wait is
+        closer to that of the slowest request than to the sum of all of them.
+        Each distinct URL is requested from the API only once, even if the same
+        provision appears in the queries more than once or in different forms,
+        such as a path and a cross-reference to it.
+
+        :param queries:
+            paths or cross-references to the desired legislative provisions, in any of
+            the forms accepted by :meth:`fetch`
+
+        :param date:
+            The date of the desired versions of the provisions, applied to every
+            query that doesn't specify its own date.
+
+        :param max_workers:
+            the greatest number of requests to make at the same time
+        """
+        urls = [self.url_from_query(query=query, date=date) for query in queries]
+        unique_urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = dict(
+                zip(unique_urls, executor.map(self._fetch_from_url, unique_urls))
+            )
+        return [parse_json(responses[url]) for url in urls]
+
+    def url_from_query(
+        self,
+        query: Union[str, CitingProvisionLocation, CrossReference, InboundReference],
+        date: Union[datetime.date, str] = "",
+    ) -> str:
+        """
+        Generate the URL that :meth:`fetch` would download for a query.
+
+        The URL always ends with a slash, so that queries for the same
+        provision in different forms give equal URLs.
+        """
+        if isinstance(query, InboundReference):
+            query = max(query.locations)
+        if isinstance(query, CitingProvisionLocation):
+            url = self.url_from_enactment_path(path=query.node, date=query.start_date)
+        elif isinstance(query, CrossReference):
+            url = self.url_from_cross_reference(query=query, date=date)
+        else:
+            url = self.url_from_enactment_path(path=query, date=date)
+        return url.rstrip("/") + "/"
+
+    def warm(
+        self,
+        paths: Sequence[str],
+        date: Union[datetime.date, str] = "",
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Download several legislative provisions ahead of time and keep the responses.
+
+        Later calls to :meth:`fetch` or :meth:`read` for the same paths and date
+        are answered from the Client's cache instead of the API, until
+        :meth:`clear_cache` or :meth:`close` is called. Unsuccessful responses
+        aren't cached, and paths that can't be downloaded are skipped without
+        raising an error, so a later :meth:`fetch` for them raises as usual.
+
+        :param paths:
+            paths to the desired legislative provisions
+
+        :param date:
+            The date of the desired versions of the provisions.
+
+        :param max_workers:
+            the greatest number of requests to make at the same time
+        """
+        urls = list(
+            dict.fromkeys(
+                self.url_from_enactment_path(path=path, date=date).rstrip("/") + "/"
+                for path in paths
+            )
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = list(executor.map(self._fetch_for_cache, urls))
+        self._response_cache.update(
+            (url, response)
+            for url, response in zip(urls, responses)
+            if response is not None and response.ok
+        )
+
+    def _fetch_for_cache(self, url: str) -> Optional[requests.Response]:
+        try:
+            return self._fetch_from_url(url)
+        except (LegislicePathError, LegisliceTokenError):
+            return None
+
     def fetch_citing_provision(self, query: CitingProvisionLocation) -> RawEnactment:
         """
         Download legislative provision as Enactment from CitingProvisionLocation.
@@ -130,6 +292,13 @@ class Client:
             ``query`` param specifies a date. If no date is provided, the API will use the
             most recent date.
         """
+        target = self.url_from_cross_reference(query=query, date=date)
+        return parse_json(self._fetch_from_url(url=target))
+
+    def url_from_cross_reference(
+        self, query: CrossReference, date: Union[datetime.date, str] = ""
+    ) -> str:
+        """Generate URL for API call for a cross-reference, optionally at another date."""
         if isinstance(date, datetime.date):
             date = date.isoformat()
 
@@ -139,13 +308,12 @@ class Client:
             if "@" in target:
                 target = target.split("@")[0]
             target = f"{target}@{date}"
-
-        return self._fetch_from_url(url=target).json()
+        return target
 
     def fetch_db_coverage(self, code_uri: str) -> Dict[str, Union[str, datetime.date]]:
         """Document date range of provisions of a code of laws available in API database."""
         target = self.api_root + "/coverage" + code_uri
-        coverage = self._fetch_from_url(url=target).json()
+        coverage = parse_json(self._fetch_from_url(url=target))
         for k, v in coverage.items():
             if k not in ("uri", "latest_heading"):
                 coverage[k] = datetime.date.fromisoformat(v)
@@ -190,15 +358,9 @@ class Client:
         self, path: str, date: Union[datetime.date, str] = ""
     ) -> str:
         """Generate URL for API call for specified USLM path and date."""
-        query_with_root = self.api_root + normalize_path(path)
-
         if isinstance(date, datetime.date):
             date = date.isoformat()
-        if date:
-            query_with_root = f"{query_with_root}@{date}"
-        elif not query_with_root.endswith("/"):
-            query_with_root += "/"
-        return query_with_root
+        return _build_url(self.api_root, path, date or "")
 
     def fetch_uri(
         self, query: str, date: Union[datetime.date, str] = ""
@@ -218,7 +380,7 @@ class Client:
         """
         url = self.url_from_enactment_path(path=query, date=date)
         response = self._fetch_from_url(url=url)
-        return response.json()
+        return parse_json(response)
 
     def uri_from_query(self, target: Union[str, Enactment, CrossReference]) -> str:
         """Get a URI for the target object."""
@@ -244,7 +406,7 @@ class Client:
         uri = self.uri_from_query(target)
         query_with_root = self.api_root + "/citations_to" + uri
         api_response = self._fetch_from_url(query_with_root)
-        return api_response.json()["results"]
+        return parse_json(api_response)["results"]
 
     def citations_to(
         self, target: Union[str, Enactment, CrossReference]
@@ -347,12 +509,34 @@ class Client:
     def update_entries_in_enactment_index(
         self, enactment_index: Mapping[str, RawEnactment]
     ) -> Mapping[str, RawEnactment]:
-        """Fill in missing fields in every entry in an :class:`~legislice.name_index.EnactmentIndex`."""
-        for key, value in enactment_index.items():
-            if enactment_needs_api_update(value["enactment"]):
-                enactment_index[key]["enactment"] = self.update_enactment_from_api(
-                    value["enactment"]
-                )
+        """
+        Fill in missing fields in every entry in an :class:`~legislice.name_index.EnactmentIndex`.
+
+        Entries for the same provision and date share one API request, but each
+        entry is updated by :meth:`update_enactment_from_api` with its own copy
+        of the downloaded data.
+        """
+        outdated = [
+            value
+            for value in enactment_index.values()
+            if enactment_needs_api_update(value["enactment"])
+        ]
+        paths_by_date: Dict[str, List[str]] = {}
+        for value in outdated:
+            start_date = value["enactment"].get("start_date") or ""
+            if isinstance(start_date, datetime.date):
+                start_date = start_date.isoformat()
+            paths_by_date.setdefault(start_date, []).append(value["enactment"]["node"])
+
+        already_cached = set(self._response_cache)
+        try:
+            for start_date, paths in paths_by_date.items():
+                self.warm(paths, date=start_date)
+            for value in outdated:
+                value["enactment"] = self.update_enactment_from_api(value["enactment"])
+        finally:
+            for url in set(self._response_cache) - already_cached:
+                del self._response_cache[url]
         return enactment_index
 
     def _fetch_from_url(self, url: str) -> requests.Response:
@@ -366,11 +550,13 @@ class Client:
             headers["Authorization"] = f"Token {self.api_token}"
 
         url = url.rstrip("/") + "/"
+        if url in self._response_cache:
+            return self._response_cache[url]
 
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
         if response.status_code == 404:
             raise LegislicePathError(f"No enacted text found for query {url}")
         if response.status_code == 403:
-            raise LegisliceTokenError(f"{response.json().get('detail')}")
+            raise LegisliceTokenError(f"{parse_json(response).get('detail')}")
 
         return response
@@ -2,26 +2,82 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from datetime import date
-from typing import Any, Dict, Sequence, List, Optional, Tuple, Union
+from itertools import islice
+import sys
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Sequence,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from anchorpoint import TextQuoteSelector, TextPositionSelector
 from anchorpoint.textselectors import TextPositionSet, TextSelectionError
 from anchorpoint.textselectors import TextPositionSetFactory
-from anchorpoint.textsequences import TextSequence
+from anchorpoint.textsequences import TextPassage, TextSequence
 
 from legislice.citations import Citation, identify_code, CodeLevel
 
-from pydantic import BaseModel, validator, root_validator
-from ranges import Range, RangeDict
+from pydantic import BaseModel, PrivateAttr, validator, root_validator
+from ranges import Inf, Range, RangeDict
 
 RawSelector = Union[str, Dict[str, str]]
 RawEnactment = Dict[str, Union[Any, str, List[RawSelector]]]
 
+_END_PUNCTUATION = ",:;. "
+_PASSAGE_SEPARATOR = "\x00"
+_MARGIN_CHARACTERS = frozenset(""",."' ;[]()""")
+_MAX_INTERNED_LENGTH = 1024
+
+
+class _ImmutableModel(BaseModel):
+    """Model that can't be changed after it's created, and that caches its hash."""
+
+    _hash: Optional[int] = PrivateAttr(default=None)
+
+    class Config:
+        frozen = True
+        copy_on_model_validation = "none"
+
+    def _hash_key(self) -> Tuple[Any, ...]:
+        """Get the field values that determine the hash."""
+        return tuple(self.__dict__.values())
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.__class__, self._hash_key()))
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave out the cached hash, which is only valid in the current process."""
+        state = super().__getstate__()
+        state["__private_attribute_values__"] = {
+            **state["__private_attribute_values__"],
+            "_hash": None,
+        }
+        return state
+
+    def _copy_and_set_values(self, *args, **kwargs) -> _ImmutableModel:
+        """Make sure a copy made with updated fields doesn't reuse a stale hash."""
+        result = super()._copy_and_set_values(*args, **kwargs)
+        result._hash = None
+        return result
+
 
-class CrossReference(BaseModel):
+class CrossReference(_ImmutableModel):
     """
     A legislative provision's citation to another provision.
 
@@ -48,7 +104,7 @@ class CrossReference(BaseModel):
         return f'CrossReference(target_uri="{self.target_uri}", reference_text="{self.reference_text}")'
 
 
-class CitingProvisionLocation(BaseModel):
+class CitingProvisionLocation(_ImmutableModel):
     """
     Memo indicating where an Enactment can be downloaded.
 
@@ -108,7 +164,7 @@ class InboundReference(BaseModel):
         return values
 
 
-class TextVersion(BaseModel):
+class TextVersion(_ImmutableModel):
     """Version of legislative text, enacted at one or more times and locations."""
 
     content: str
@@ -121,6 +177,8 @@ class TextVersion(BaseModel):
             raise ValueError(
                 "TextVersion should not be created with an empty string for content."
             )
+        if len(content) <= _MAX_INTERNED_LENGTH:
+            return sys.intern(content)
         return content
 
 
@@ -138,7 +196,212 @@ class EnactmentMemo(BaseModel):
     end_date: Optional[date] = None
 
 
-class Enactment(BaseModel):
+def _stripped_texts(sequence: TextSequence) -> Tuple[Optional[str], ...]:
+    """Get the text of each passage without end punctuation, keeping ``None`` markers."""
+    return tuple(
+        None if passage is None else passage.text.strip(_END_PUNCTUATION)
+        for passage in sequence.passages
+    )
+
+
+def _canonical_passages(sequence: TextSequence) -> Tuple[Optional[str], ...]:
+    """
+    Get a tuple that is equal for two TextSequences that have the same meaning.
+
+    Comparing these tuples gives the same result as :meth:`TextSequence.means`.
+    Leading and trailing ``None`` markers are skipped by index, instead of
+    copying the passages with :meth:`TextSequence.strip`.
+    """
+    passages = sequence.passages
+    start, stop = 0, len(passages)
+    if stop and passages[0] is None:
+        start = 1
+    if stop > start and passages[stop - 1] is None:
+        stop -= 1
+    return tuple(
+        None if passage is None else passage.text.strip(_END_PUNCTUATION)
+        for passage in islice(passages, start, stop)
+    )
+
+
+def _sequence_implies(left: TextSequence, right: TextSequence) -> bool:
+    """
+    Test whether each passage of ``right`` appears within some passage of ``left``.
+
+    Gives the same result as ``left >= right``, but strips each passage
+    of ``right`` once, and searches for it in a single string joining the
+    passages of ``left`` with a separator character. A match can't cross
+    the separator unless the passage being searched for contains it, so
+    only those rare passages are searched for in each passage of ``left``.
+    """
+    if not left.passages:
+        return not right.passages
+    left_texts = [passage.text for passage in left.passages if passage is not None]
+    haystack = _PASSAGE_SEPARATOR.join(left_texts)
+    for needle in _stripped_texts(right):
+        if needle is None:
+            continue
+        if not left_texts:
+            return False
+        if _PASSAGE_SEPARATOR in needle:
+            found = any(needle in text for text in left_texts)
+        else:
+            found = needle in haystack
+        if not found:
+            return False
+    return True
+
+
+def _sequence_as_string(sequence: TextSequence) -> str:
+    """
+    Join the passages of a TextSequence into one string, with ellipses for ``None`` markers.
+
+    Gives the same result as ``str(sequence)``, but joins a list of parts
+    once instead of concatenating a string for each passage.
+    """
+    parts: List[str] = []
+    last_character = ""
+    for passage in sequence.passages:
+        if passage is None:
+            if last_character != "…":
+                parts.append("…")
+                last_character = "…"
+            continue
+        if last_character and last_character not in ("…", " "):
+            parts.append(" ")
+            last_character = " "
+        if passage.text:
+            parts.append(passage.text)
+            last_character = passage.text[-1]
+    result = "".join(parts)
+    return "" if result == "…" else result
+
+
+def _ranges_cover(outer: List[Range], inner: List[Range]) -> bool:
+    """Check whether each of the sorted, disjoint ``inner`` ranges is inside one of ``outer``."""
+    index = 0
+    for span in inner:
+        while index < len(outer) and outer[index].end <= span.start:
+            index += 1
+        if index == len(outer):
+            return False
+        if outer[index].start > span.start or outer[index].end < span.end:
+            return False
+    return True
+
+
+def _selection_covers(
+    left: Union[Enactment, EnactmentPassage], right: Union[Enactment, EnactmentPassage]
+) -> bool:
+    """
+    Check whether ``left`` selects every text position that ``right`` selects.
+
+    This is a shortcut for comparing passages from the same version of the same
+    provision. A False result doesn't mean that ``left`` fails to imply ``right``.
+    """
+    if left.node != right.node or left.text != right.text:
+        return False
+    left_ranges = left._selection_ranges()
+    right_ranges = right._selection_ranges()
+    if left_ranges is None or right_ranges is None:
+        return False
+    return _ranges_cover(outer=left_ranges, inner=right_ranges)
+
+
+def _implies_without_same_meaning(
+    left: Union[Enactment, EnactmentPassage], right: Union[Enactment, EnactmentPassage]
+) -> bool:
+    """
+    Test whether ``left`` implies ``right`` without having the same meaning.
+
+    Builds each side's TextSequence only once, and uses the same sequences
+    for both tests. ``None`` markers in the sequences don't affect the
+    implication test.
+    """
+    if not isinstance(right, (Enactment, EnactmentPassage)):
+        raise TypeError(
+            f"Cannot compare {left.__class__.__name__} and {right.__class__.__name__} for same meaning."
+        )
+    left_passages = left.text_sequence()
+    right_passages = right.text_sequence()
+    if _canonical_passages(left_passages) == _canonical_passages(right_passages):
+        return False
+    return _selection_covers(left, right) or _sequence_implies(
+        left_passages, right_passages
+    )
+
+
+def _merge_with_margin(
+    selectors: Sequence[TextPositionSelector],
+    text: str,
+    margin_width: int,
+    margin_characters: FrozenSet[str] = _MARGIN_CHARACTERS,
+) -> TextPositionSet:
+    """
+    Merge position selectors, joining any that are separated only by a margin of punctuation.
+
+    Gives the same result as combining the selectors into a TextPositionSet
+    and then calling :meth:`~anchorpoint.textselectors.TextPositionSet.add_margin`,
+    but sorts and sweeps the selectors once instead of building intermediate sets.
+    """
+    spans = sorted(
+        (selector.start, selector.end if selector.end is not None else Inf)
+        for selector in selectors
+    )
+    merged: List[List[Any]] = []
+    for start, end in spans:
+        if merged:
+            previous = merged[-1]
+            if start <= previous[1] or (
+                start <= previous[1] + margin_width
+                and margin_characters.issuperset(text[previous[1] : start])
+            ):
+                previous[1] = max(previous[1], end)
+                continue
+        merged.append([start, end])
+    return _selection_from_spans(merged)
+
+
+def _clip_selectors(
+    selectors: Sequence[TextPositionSelector], limit: TextPositionSelector
+) -> TextPositionSet:
+    """
+    Get the parts of the selected ranges that are within ``limit``.
+
+    Gives the same result as intersecting a TextPositionSet of the selectors
+    with ``limit``, but clips each selector directly instead of building
+    RangeSets for both operands.
+    """
+    limit_end = Inf if limit.end is None else limit.end
+    spans = sorted(
+        (
+            max(selector.start, limit.start),
+            min(Inf if selector.end is None else selector.end, limit_end),
+        )
+        for selector in selectors
+    )
+    merged: List[List[Any]] = []
+    for start, end in spans:
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return _selection_from_spans(merged)
+
+
+def _selection_from_spans(spans: List[List[Any]]) -> TextPositionSet:
+    """Make a TextPositionSet from sorted, disjoint spans, using ``Inf`` for an open end."""
+    return TextPositionSet.construct(
+        positions=[
+            TextPositionSelector.construct(start=start, end=None if end == Inf else end)
+            for start, end in spans
+        ]
+    )
+
+
+class Enactment(_ImmutableModel):
     """
     Base class for Enactments.
 
@@ -198,7 +461,28 @@ class Enactment(BaseModel):
     ] = []
     citations: List[CrossReference] = []
     name: str = ""
-    children: Union[List[Enactment], List[str]] = []
+    children: Union[Tuple[Enactment, ...], Tuple[str, ...]] = ()
+
+    _text_cache: Optional[str] = PrivateAttr(default=None)
+    _nested_cache: Optional[Tuple[Enactment, ...]] = PrivateAttr(default=None)
+    _id_parts: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+    _padded_length: Optional[int] = PrivateAttr(default=None)
+    _span_length: Optional[int] = PrivateAttr(default=None)
+    _level: Optional[CodeLevel] = PrivateAttr(default=None)
+    _factory_cache: Optional[TextPositionSetFactory] = PrivateAttr(default=None)
+    _child_cache: Optional[Dict[str, Tuple[Enactment, int]]] = PrivateAttr(default=None)
+    _sequence_cache: Optional[Dict[bool, Tuple[Optional[str], ...]]] = PrivateAttr(
+        default=None
+    )
+    _canonical_cache: Optional[Tuple[Optional[str], ...]] = PrivateAttr(default=None)
+    _quote_cache: Optional[Dict[Tuple[str, str, str], TextPositionSelector]] = (
+        PrivateAttr(default=None)
+    )
+
+    @validator("node")
+    def intern_node(cls, value: str) -> str:
+        """Share one string object among Enactments with the same node identifier."""
+        return sys.intern(value)
 
     @validator("text_version", pre=True)
     def make_text_version_from_str(
@@ -211,6 +495,31 @@ class Enactment(BaseModel):
             return None
         return value or None
 
+    def _hash_key(self) -> Tuple[Any, ...]:
+        return (self.node, self.start_date, self.content)
+
+    def _clear_cached_values(self) -> None:
+        """Discard values derived from this node's identifier, text, and children."""
+        self._text_cache = None
+        self._nested_cache = None
+        self._id_parts = None
+        self._padded_length = None
+        self._span_length = None
+        self._level = None
+        self._factory_cache = None
+        self._child_cache = None
+        self._sequence_cache = None
+        self._canonical_cache = None
+        self._quote_cache = None
+
+    def _copy_and_set_values(self, values, *args, **kwargs) -> Enactment:
+        """Make sure a copy made with updated fields doesn't reuse stale cached values."""
+        if isinstance(values.get("children"), list):
+            values = {**values, "children": tuple(values["children"])}
+        result = super()._copy_and_set_values(values, *args, **kwargs)
+        result._clear_cached_values()
+        return result
+
     @property
     def content(self) -> str:
         """Get text for this version of the Enactment."""
@@ -218,14 +527,28 @@ class Enactment(BaseModel):
             return ""
         return self.text_version.content
 
+    def _enactment_children(self) -> Tuple[Enactment, ...]:
+        """Get the children that are Enactments, collected once per Enactment."""
+        if self._nested_cache is None:
+            self._nested_cache = tuple(
+                child for child in self.children if isinstance(child, Enactment)
+            )
+        return self._nested_cache
+
     @property
     def nested_children(self):
         """Get nested children attribute."""
-        return [child for child in self.children if isinstance(child, Enactment)]
+        return list(self._enactment_children())
+
+    def _node_parts(self) -> Tuple[str, ...]:
+        """Get the node identifier split on slashes, computed once per Enactment."""
+        if self._id_parts is None:
+            self._id_parts = tuple(sys.intern(part) for part in self.node.split("/"))
+        return self._id_parts
 
     def get_identifier_part(self, index: int) -> Optional[str]:
         """Get a part of the split node identifier, by number."""
-        identifier_parts = self.node.split("/")
+        identifier_parts = self._node_parts()
         if len(identifier_parts) < (index + 1):
             return None
         return identifier_parts[index]
@@ -233,7 +556,8 @@ class Enactment(BaseModel):
     @property
     def sovereign(self):
         """Get "sovereign" part of node identifier."""
-        return self.get_identifier_part(1)
+        parts = self._node_parts()
+        return parts[1] if len(parts) > 1 else None
 
     @property
     def jurisdiction(self):
@@ -243,17 +567,20 @@ class Enactment(BaseModel):
     @property
     def code(self):
         """Get "code" part of node identifier."""
-        return self.get_identifier_part(2)
+        parts = self._node_parts()
+        return parts[2] if len(parts) > 2 else None
 
     @property
     def title(self):
         """Get "title" part of node identifier."""
-        return self.get_identifier_part(3)
+        parts = self._node_parts()
+        return parts[3] if len(parts) > 3 else None
 
     @property
     def section(self):
         """Get "section" part of node identifier."""
-        return self.get_identifier_part(4)
+        parts = self._node_parts()
+        return parts[4] if len(parts) > 4 else None
 
     @property
     def is_federal(self):
@@ -263,15 +590,17 @@ class Enactment(BaseModel):
     @property
     def level(self) -> str:
         """Get level of code for this Enactment, e.g. "statute" or "regulation"."""
-        code_name, code_level_name = identify_code(self.sovereign, self.code)
-        return code_level_name
+        if self._level is None:
+            code_name, self._level = identify_code(self.sovereign, self.code)
+        return self._level
 
     @property
     def padded_length(self):
         """Get length of self's content plus one character for space before next section."""
-        if self.content:
-            return len(self.content) + 1
-        return 0
+        if self._padded_length is None:
+            content = self.content
+            self._padded_length = len(content) + 1 if content else 0
+        return self._padded_length
 
     @property
     def known_revision_date(self) -> bool:
@@ -309,10 +638,21 @@ class Enactment(BaseModel):
 
     def cross_references(self) -> List[CrossReference]:
         """Return all cross-references from this node and subnodes."""
-        result = self.citations[:]
-        for child in self.nested_children:
-            result += child.cross_references()
-        return result
+        return list(self.iter_cross_references())
+
+    def iter_cross_references(self) -> Iterator[CrossReference]:
+        """Yield cross-references from this node and subnodes, in text order."""
+        stack: List[Enactment] = [self]
+        while stack:
+            node = stack.pop()
+            yield from node.citations
+            stack.extend(reversed(node._enactment_children()))
+
+    def _get_factory(self) -> TextPositionSetFactory:
+        """Get a factory for making selections from this Enactment's text."""
+        if self._factory_cache is None:
+            self._factory_cache = TextPositionSetFactory(text=self.text)
+        return self._factory_cache
 
     def get_string(
         self,
@@ -326,7 +666,7 @@ class Enactment(BaseModel):
     ) -> str:
         """Use text selector to get corresponding string from Enactment."""
         position_set = self.convert_selection_to_set(selection)
-        return position_set.as_string(text=self.text)
+        return _sequence_as_string(position_set.as_text_sequence(text=self.text))
 
     def convert_selection_to_set(
         self,
@@ -342,15 +682,35 @@ class Enactment(BaseModel):
         """Create a TextPositionSet from a different selection method."""
         if selection is True:
             return self.make_selection_of_all_text()
-        factory = TextPositionSetFactory(self.text)
+        if isinstance(selection, str):
+            selection = TextQuoteSelector.from_text(selection)
+        if isinstance(selection, TextQuoteSelector):
+            selection = [selection]
+        if isinstance(selection, (list, tuple)) and all(
+            isinstance(item, TextQuoteSelector) for item in selection
+        ):
+            return self.convert_quotes_to_position(selection)
+        factory = self._get_factory()
         return factory.from_selection(selection)
 
+    def _locate_quote(self, quote: TextQuoteSelector) -> TextPositionSelector:
+        """Find the position of a quote in this Enactment's text, remembering the result."""
+        if self._quote_cache is None:
+            self._quote_cache = {}
+        key = (quote.prefix, quote.exact, quote.suffix)
+        position = self._quote_cache.get(key)
+        if position is None:
+            position = quote.as_position(self.text)
+            self._quote_cache[key] = position
+        return position
+
     def convert_quotes_to_position(
         self, quotes: Sequence[TextQuoteSelector]
     ) -> TextPositionSet:
         """Convert quote selector to the corresponding position selector for this Enactment."""
-        factory = TextPositionSetFactory(text=self.text)
-        return factory.from_quote_selectors(quotes)
+        return TextPositionSet(
+            positions=[self._locate_quote(quote) for quote in quotes]
+        )
 
     def limit_selection(
         self,
@@ -363,7 +723,7 @@ class Enactment(BaseModel):
         limit_selector = TextPositionSelector.from_text(
             text=self.text, start=start, end=end
         )
-        return selection & limit_selector
+        return _clip_selectors(selection.positions, limit_selector)
 
     def limit_selection_to_current_node(
         self, selection: TextPositionSet
@@ -373,8 +733,32 @@ class Enactment(BaseModel):
 
     def text_sequence(self, include_nones=True) -> TextSequence:
         """Get a sequence of text passages for this provision and its subnodes."""
-        selection = self.tree_selection()
-        return selection.as_text_sequence(text=self.text, include_nones=include_nones)
+        if self._sequence_cache is None:
+            self._sequence_cache = {}
+        include_nones = bool(include_nones)
+        if include_nones not in self._sequence_cache:
+            texts: List[Optional[str]] = []
+            stack: List[Enactment] = [self]
+            while stack:
+                node = stack.pop()
+                if node.content:
+                    if include_nones and texts:
+                        texts.append(None)
+                    texts.append(node.content)
+                stack.extend(reversed(node._enactment_children()))
+            self._sequence_cache[include_nones] = tuple(texts)
+        return TextSequence(
+            [
+                None if text is None else TextPassage(text)
+                for text in self._sequence_cache[include_nones]
+            ]
+        )
+
+    def _canonical_passages(self) -> Tuple[Optional[str], ...]:
+        """Get the passages compared by :meth:`means`, computed once per Enactment."""
+        if self._canonical_cache is None:
+            self._canonical_cache = _canonical_passages(self.text_sequence())
+        return self._canonical_cache
 
     def means(self, other: Union[Enactment, EnactmentPassage]) -> bool:
         """Determine if self and other have identical text."""
@@ -382,9 +766,9 @@ class Enactment(BaseModel):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for same meaning."
             )
-        self_selected_passages = self.text_sequence()
-        other_selected_passages = other.text_sequence()
-        return self_selected_passages.means(other_selected_passages)
+        if isinstance(other, Enactment) and self == other:
+            return True
+        return self._canonical_passages() == other._canonical_passages()
 
     def select(
         self,
@@ -411,10 +795,10 @@ class Enactment(BaseModel):
     def make_selection_of_all_text(self) -> TextPositionSet:
         """Return a TextPositionSet of all text in this Enactment."""
         if self.text:
-            return TextPositionSet(
-                positions=TextPositionSelector(start=0, end=len(self.text))
+            return TextPositionSet.construct(
+                positions=[TextPositionSelector.construct(start=0, end=len(self.text))]
             )
-        return TextPositionSet()
+        return TextPositionSet.construct()
 
     def make_selection(
         self,
@@ -443,16 +827,17 @@ class Enactment(BaseModel):
 
     def raise_error_for_extra_selector(self, selection: TextPositionSet) -> None:
         """Raise an error if any passed selectors begin after the end of the text passage."""
+        text_length = len(self.text) + 1
         for selector in selection.positions:
-            if selector.start > len(self.text) + 1:
+            if selector.start > text_length:
                 raise ValueError(f'Selector "{selector}" was not used.')
 
     def make_selection_of_this_node(self) -> TextPositionSet:
         """Return a TextPositionSet of the text at this node, not child nodes."""
         if not self.content:
-            return TextPositionSet()
-        return TextPositionSet(
-            positions=TextPositionSelector(start=0, end=len(self.content))
+            return TextPositionSet.construct()
+        return TextPositionSet.construct(
+            positions=[TextPositionSelector.construct(start=0, end=len(self.content))]
         )
 
     def _rangedict(
@@ -468,7 +853,7 @@ class Enactment(BaseModel):
             )
         new_tree_length = tree_length + self.padded_length
 
-        for child in self.nested_children:
+        for child in self._enactment_children():
             range_dict, new_tree_length = child._rangedict(
                 range_dict=range_dict, tree_length=new_tree_length
             )
@@ -482,34 +867,72 @@ class Enactment(BaseModel):
         )
         return new_range_dict
 
+    def _children_by_node(self) -> Dict[str, Tuple[Enactment, int]]:
+        """Map each nested child's node to the child and its offset in this Enactment's text."""
+        if self._child_cache is None:
+            result: Dict[str, Tuple[Enactment, int]] = {}
+            offset = self.padded_length
+            for child in self._enactment_children():
+                result[child.node] = (child, offset)
+                offset += child.span_length
+            self._child_cache = result
+        return self._child_cache
+
+    def locate_descendant(self, node: str) -> Optional[Tuple[Enactment, int]]:
+        """
+        Find a nested Enactment by its node identifier.
+
+        :param node:
+            the identifier of this Enactment or of one of its nested descendants
+
+        :returns:
+            the descendant Enactment and the position where its text starts in
+            this Enactment's text, or None if no nested descendant has that node
+        """
+        target_parts = node.split("/")
+        depth = len(self.node.split("/"))
+        current: Enactment = self
+        offset = 0
+        while current.node != node:
+            depth += 1
+            if depth > len(target_parts):
+                return None
+            found = current._children_by_node().get("/".join(target_parts[:depth]))
+            if found is None:
+                return None
+            current, child_offset = found
+            offset += child_offset
+        return current, offset
+
     @property
     def span_length(self) -> int:
         """Return the length of the span of this Enactment."""
-        return self.padded_length + sum(
-            child.span_length for child in self.nested_children
-        )
-
-    def _tree_selection(
-        self, selector_set: TextPositionSet, tree_length: int
-    ) -> Tuple[TextPositionSet, int]:
-        selectors_at_node = self.make_selection_of_this_node()
-        selectors_at_node_with_offset = selectors_at_node + tree_length
-        new_tree_length = tree_length + self.padded_length
-        new_selector_set = selector_set + selectors_at_node_with_offset
-
-        for child in self.nested_children:
-            new_selector_set, new_tree_length = child._tree_selection(
-                selector_set=new_selector_set, tree_length=new_tree_length
+        if self._span_length is None:
+            self._span_length = self.padded_length + sum(
+                child.span_length for child in self._enactment_children()
             )
+        return self._span_length
 
-        return new_selector_set, new_tree_length
+    def _selection_ranges(self) -> Optional[List[Range]]:
+        return self.tree_selection().ranges()
 
     def tree_selection(self) -> TextPositionSet:
         """Return set of selectors for selected text in this provision and its children."""
-        new_selector_set, new_tree_length = self._tree_selection(
-            selector_set=TextPositionSet(), tree_length=0
-        )
-        return new_selector_set
+        positions: List[TextPositionSelector] = []
+        tree_length = 0
+        stack: List[Enactment] = [self]
+        while stack:
+            node = stack.pop()
+            content_length = len(node.content)
+            if content_length:
+                positions.append(
+                    TextPositionSelector.construct(
+                        start=tree_length, end=tree_length + content_length
+                    )
+                )
+            tree_length += node.padded_length
+            stack.extend(reversed(node._enactment_children()))
+        return TextPositionSet.construct(positions=positions)
 
     def csl_json(self) -> str:
         """
@@ -529,13 +952,16 @@ class Enactment(BaseModel):
     @property
     def text(self):
         """Get all text including subnodes, regardless of which text is "selected"."""
-        text_parts = [self.content]
+        if self._text_cache is None:
+            text_parts = [self.content]
 
-        for child in self.nested_children:
-            if child.text:
-                text_parts.append(child.text)
-        joined = " ".join(text_parts)
-        return joined.strip()
+            for child in self._enactment_children():
+                child_text = child.text
+                if child_text:
+                    text_parts.append(child_text)
+            joined = " ".join(text_parts)
+            self._text_cache = joined.strip()
+        return self._text_cache
 
     def implies(self, other: Union[Enactment, EnactmentPassage]) -> bool:
         """Test whether ``self`` has all the text passages of ``other``."""
@@ -543,9 +969,11 @@ class Enactment(BaseModel):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for implication."
             )
+        if _selection_covers(self, other):
+            return True
         self_selected_passages = self.text_sequence(include_nones=False)
         other_selected_passages = other.text_sequence(include_nones=False)
-        return self_selected_passages >= other_selected_passages
+        return _sequence_implies(self_selected_passages, other_selected_passages)
 
     def __ge__(self, other: Union[Enactment, EnactmentPassage]) -> bool:
         """
@@ -558,9 +986,7 @@ class Enactment(BaseModel):
 
     def __gt__(self, other) -> bool:
         """Test whether ``self`` implies ``other`` without having same meaning."""
-        if self.means(other):
-            return False
-        return self.implies(other)
+        return _implies_without_same_meaning(self, other)
 
 
 Enactment.update_forward_refs()
@@ -618,15 +1044,28 @@ class EnactmentPassage(BaseModel):
     def child_passages(self) -> List[EnactmentPassage]:
         """Return a list of EnactmentPassages for this Enactment's children."""
         result: List[EnactmentPassage] = []
+        ranges = self.selection.ranges()
+        index = 0
         tree_length = self.enactment.padded_length
-        for child in self.enactment.nested_children:
-            selection = self.selection & TextPositionSelector(
-                start=tree_length, end=tree_length + child.span_length
-            )
-            result.append(
-                EnactmentPassage(enactment=child, selection=selection - tree_length)
-            )
-            tree_length += child.span_length
+        for child in self.enactment._enactment_children():
+            child_end = tree_length + child.span_length
+            while index < len(ranges) and ranges[index].end <= tree_length:
+                index += 1
+            positions: List[TextPositionSelector] = []
+            cursor = index
+            while cursor < len(ranges) and ranges[cursor].start < child_end:
+                span = ranges[cursor]
+                start = max(span.start, tree_length)
+                end = child_end if span.end > child_end else span.end
+                positions.append(
+                    TextPositionSelector.construct(
+                        start=start - tree_length, end=end - tree_length
+                    )
+                )
+                cursor += 1
+            selection = TextPositionSet.construct(positions=positions)
+            result.append(EnactmentPassage(enactment=child, selection=selection))
+            tree_length = child_end
         return result
 
     @property
@@ -656,6 +1095,11 @@ class EnactmentPassage(BaseModel):
         """Get the node that this Enactment is from."""
         return self.enactment.node
 
+    def _selection_ranges(self) -> Optional[List[Range]]:
+        if self.selection.quotes:
+            return None
+        return self.selection.ranges()
+
     def as_quotes(self) -> List[TextQuoteSelector]:
         """Return quote selectors for the selected text."""
         return [
@@ -669,8 +1113,8 @@ class EnactmentPassage(BaseModel):
     def select_all(self) -> None:
         """Select all text of Enactment."""
         text = self.enactment.text
-        self.selection = TextPositionSet(
-            positions=[TextPositionSelector(start=0, end=len(text))]
+        self.selection = TextPositionSet.construct(
+            positions=[TextPositionSelector.construct(start=0, end=len(text))]
         )
         return None
 
@@ -684,8 +1128,7 @@ class EnactmentPassage(BaseModel):
         limit_selector = TextPositionSelector.from_text(
             text=self.text, start=start, end=end
         )
-        new_selection = self.selection & limit_selector
-        self.selection = new_selection
+        self.selection = _clip_selectors(self.selection.positions, limit_selector)
         return None
 
     def select_more_text_at_current_node(
@@ -707,8 +1150,26 @@ class EnactmentPassage(BaseModel):
             else:
                 self.select_more_text_from_changed_version(other)
             return found_node, True
-        for selector in other.as_quotes():
-            self.select_more(selector)
+        located = self.enactment.locate_descendant(other.node)
+        if located and located[0].text == other.text:
+            descendant, offset = located
+            text_length = len(descendant.text)
+            positions: List[TextPositionSelector] = []
+            for selector in other.selection.positions:
+                end = (
+                    text_length
+                    if selector.end is None
+                    else min(selector.end, text_length)
+                )
+                if selector.start < end:
+                    positions.append(
+                        TextPositionSelector.construct(
+                            start=selector.start + offset, end=end + offset
+                        )
+                    )
+            self.select_more(TextPositionSet.construct(positions=positions))
+            return False, False
+        self.select_more(other.as_quotes())
         return False, False
 
     def _add_passage_at_included_node(
@@ -719,7 +1180,7 @@ class EnactmentPassage(BaseModel):
         if self >= other:
             return self
 
-        copy_of_self = deepcopy(self)
+        copy_of_self = self.copy()
         copy_of_self._update_text_at_included_node(other)
         return copy_of_self
 
@@ -729,9 +1190,11 @@ class EnactmentPassage(BaseModel):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for implication."
             )
+        if _selection_covers(self, other):
+            return True
         self_selected_passages = self.text_sequence(include_nones=False)
         other_selected_passages = other.text_sequence(include_nones=False)
-        return self_selected_passages >= other_selected_passages
+        return _sequence_implies(self_selected_passages, other_selected_passages)
 
     def __add__(self, other: Union[Enactment, EnactmentPassage]) -> EnactmentPassage:
 
@@ -739,7 +1202,7 @@ class EnactmentPassage(BaseModel):
             other = other.select_all()
 
         if not isinstance(other, self.__class__):
-            copy_of_self = deepcopy(self)
+            copy_of_self = self.copy()
             copy_of_self.select_more(other)
             return copy_of_self
 
@@ -764,9 +1227,7 @@ class EnactmentPassage(BaseModel):
 
     def __gt__(self, other) -> bool:
         """Test whether ``self`` implies ``other`` without having same meaning."""
-        if self.means(other):
-            return False
-        return self.implies(other)
+        return _implies_without_same_meaning(self, other)
 
     def select(
         self,
@@ -790,7 +1251,7 @@ class EnactmentPassage(BaseModel):
 
     def clear_selection(self) -> None:
         """Deselect any Enactment text, including in child nodes."""
-        self.selection = TextPositionSet()
+        self.selection = TextPositionSet.construct()
 
     def select_more_text_from_changed_version(self, other: EnactmentPassage) -> None:
         """
@@ -823,7 +1284,7 @@ class EnactmentPassage(BaseModel):
         text content and the ranges in its selection attribute.
         """
         text_sequence = self.text_sequence()
-        return str(text_sequence)
+        return _sequence_as_string(text_sequence)
 
     def text_sequence(self, include_nones: bool = True) -> TextSequence:
         """
@@ -838,6 +1299,10 @@ class EnactmentPassage(BaseModel):
         )
         return selected
 
+    def _canonical_passages(self) -> Tuple[Optional[str], ...]:
+        """Get the passages compared by :meth:`means`."""
+        return _canonical_passages(self.text_sequence())
+
     def select_more(
         self,
         selection: Union[
@@ -852,8 +1317,16 @@ class EnactmentPassage(BaseModel):
         if not isinstance(selection, TextPositionSet):
             selection = self.enactment.convert_selection_to_set(selection)
 
-        self.selection += selection
-        self.selection = self.selection.add_margin(text=self.text, margin_width=4)
+        text = self.text
+        self.selection = _merge_with_margin(
+            selectors=[
+                *self.selection.positions,
+                *selection.positions,
+                *self.selection.positions_of_quote_selectors(text),
+            ],
+            text=text,
+            margin_width=4,
+        )
         self.enactment.raise_error_for_extra_selector(selection)
 
     def select_more_text_in_current_branch(
@@ -879,9 +1352,13 @@ class EnactmentPassage(BaseModel):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for same meaning."
             )
-        self_selected_passages = self.text_sequence()
-        other_selected_passages = other.text_sequence()
-        return self_selected_passages.means(other_selected_passages)
+        if (
+            isinstance(other, EnactmentPassage)
+            and self.enactment == other.enactment
+            and self.selection == other.selection
+        ):
+            return True
+        return self._canonical_passages() == other._canonical_passages()
 
 
 class AnchoredEnactmentPassage(BaseModel):
@@ -900,6 +1377,32 @@ class AnchoredEnactmentPassage(BaseModel):
     anchors: TextPositionSet
 
 
+def _consolidate_related_passages(
+    passages: List[EnactmentPassage],
+) -> List[EnactmentPassage]:
+    """
+    Consolidate passages that may be combinable because their nodes share a prefix.
+
+    Passages can only be added if one's node starts with the other's, so
+    :func:`consolidate_enactments` only has to compare passages within
+    these groups, instead of every pair in its input.
+    """
+    consolidated: List[EnactmentPassage] = []
+    while passages:
+        left = passages.pop()
+        for index, right in enumerate(passages):
+            try:
+                combined = left + right
+            except (ValueError, TypeError, TextSelectionError):
+                continue
+            passages[index] = passages[-1]
+            passages[-1] = combined
+            break
+        else:
+            consolidated.append(left)
+    return consolidated
+
+
 def consolidate_enactments(
     enactments: Sequence[Union[Enactment, EnactmentPassage]]
 ) -> List[EnactmentPassage]:
@@ -913,23 +1416,21 @@ def consolidate_enactments(
     :returns:
         a list of :class:`Enactment`\s without overlapping text
     """
-    consolidated: List[Enactment] = []
-    enactments = [
-        item.select_all() if isinstance(item, Enactment) else item
-        for item in enactments
-    ]
-    while enactments:
-        match_made = False
-        left = enactments.pop()
-        for right in enactments:
-            try:
-                combined = left + right
-                enactments.remove(right)
-                enactments.append(combined)
-                match_made = True
-                break
-            except (ValueError, TypeError, TextSelectionError):
-                pass
-        if not match_made:
-            consolidated.append(left)
+    consolidated: List[EnactmentPassage] = []
+    passages: List[EnactmentPassage] = []
+    for item in enactments:
+        if isinstance(item, Enactment):
+            passages.append(item.select_all())
+        elif isinstance(item, EnactmentPassage):
+            passages.append(item)
+        else:
+            consolidated.append(item)
+    passages.sort(key=lambda passage: passage.node)
+    related: List[EnactmentPassage] = []
+    for passage in passages:
+        if related and not passage.node.startswith(related[0].node):
+            consolidated.extend(_consolidate_related_passages(related))
+            related = []
+        related.append(passage)
+    consolidated.extend(_consolidate_related_passages(related))
     return consolidated
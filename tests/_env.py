@@ -0,0 +1,10 @@
+"""Environment settings shared by the test modules, loaded once per session."""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+API_ROOT = "https://authorityspoke.com/api/v1"
+TOKEN = os.getenv("LEGISLICE_API_TOKEN")
@@ -1,29 +1,31 @@
+import copy
 import datetime
-import os
-from typing import Dict
+from typing import Dict, Iterator
 
 from anchorpoint import TextQuoteSelector
-from dotenv import load_dotenv
 import pytest
+from vcr import VCR
 
 from legislice.download import Client
+from legislice.enactments import Enactment
 
-load_dotenv()
+from ._env import API_ROOT, TOKEN
 
-API_ROOT = "https://authorityspoke.com/api/v1"
-TOKEN = os.getenv("LEGISLICE_API_TOKEN")
 
-
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def vcr_config():
     return {
         # Replace the Authorization request header with "DUMMY" in cassettes
         "filter_headers": [("authorization", "DUMMY")],
+        "decode_compressed_response": True,
+        # JSON cassettes load much faster than YAML ones
+        "serializer": "json",
+        "path_transformer": VCR.ensure_suffix(".json"),
     }
 
 
-@pytest.fixture(scope="class")
-def test_client() -> Client:
+@pytest.fixture(scope="session")
+def test_client() -> Iterator[Client]:
     client = Client(api_token=TOKEN)
     client.coverage["/us/usc"] = {
         "latest_heading": "United States Code (USC)",
@@ -37,7 +39,8 @@ def test_client() -> Client:
         "earliest_in_db": datetime.date(1935, 4, 1),
         "latest_in_db": datetime.date(2013, 7, 18),
     }
-    return client
+    with client:
+        yield client
 
 
 @pytest.fixture(scope="class")
@@ -355,6 +358,26 @@ def citation_to_6c():
     }
 
 
+@pytest.fixture()
+def section6c_without_children():
+    return {
+        "heading": "Issuance of beardcoin",
+        "text_version": "Where an exemption is granted under section 6…",
+        "node": "/test/acts/47/6C",
+        "start_date": "1935-04-01",
+    }
+
+
+@pytest.fixture()
+def section6c_1():
+    return {
+        "heading": "",
+        "text_version": "The beardcoin shall be a cryptocurrency token…",
+        "node": "/test/acts/47/6C/1",
+        "start_date": "2013-07-18",
+    }
+
+
 @pytest.fixture(scope="function")
 def section_11_subdivided():
     return {
@@ -540,8 +563,8 @@ def third_a(test_client):
     )
 
 
-@pytest.fixture(scope="class")
-def fourth_a():
+@pytest.fixture(scope="session")
+def _fourth_a_data():
     return {
         "heading": "AMENDMENT IV.",
         "start_date": "1791-12-15",
@@ -559,6 +582,16 @@ def fourth_a():
     }
 
 
+@pytest.fixture(scope="class")
+def fourth_a(_fourth_a_data):
+    return copy.deepcopy(_fourth_a_data)
+
+
+@pytest.fixture(scope="session")
+def fourth_a_enactment(_fourth_a_data) -> Enactment:
+    return Enactment(**copy.deepcopy(_fourth_a_data))
+
+
 @pytest.fixture(scope="module")
 def fourth_a_no_text_version():
     return {
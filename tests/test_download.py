@@ -1,10 +1,8 @@
 import datetime
 from legislice import download
 from legislice.enactments import CitingProvisionLocation, CrossReference
-import os
 
 from anchorpoint import TextQuoteSelector
-from dotenv import load_dotenv
 import pytest
 
 from legislice.download import (
@@ -15,20 +13,20 @@ from legislice.download import (
 )
 from legislice.enactments import InboundReference
 
+from ._env import API_ROOT, TOKEN
 
-load_dotenv()
-
-TOKEN = os.getenv("LEGISLICE_API_TOKEN")
-API_ROOT = "https://authorityspoke.com/api/v1"
+JAN_1_1940 = datetime.date(1940, 1, 1)
+JAN_1_1950 = datetime.date(1950, 1, 1)
+DEC_15_2010 = datetime.date(2010, 12, 15)
+JUL_18_2013 = datetime.date(2013, 7, 18)
+JAN_1_2020 = datetime.date(2020, 1, 1)
 
 
 class TestDownloadJSON:
-    client = Client(api_token=TOKEN, api_root=API_ROOT)
-
     @pytest.mark.vcr()
     def test_fetch_section(self, test_client):
-        url = self.client.url_from_enactment_path("/test/acts/47/1")
-        response = self.client._fetch_from_url(url=url)
+        url = test_client.url_from_enactment_path("/test/acts/47/1")
+        response = test_client._fetch_from_url(url=url)
 
         # Test that there was no redirect from the API
         assert not response.history
@@ -38,18 +36,75 @@ class TestDownloadJSON:
         assert section["end_date"] is None
         assert section["heading"] == "Short title"
 
+    @pytest.mark.vcr()
+    def test_fetch_with_client_as_context_manager(self):
+        with Client(api_token=TOKEN, api_root=API_ROOT) as client:
+            section = client.fetch(query="/test/acts/47/1")
+        assert section["heading"] == "Short title"
+
+    @pytest.mark.vcr()
+    def test_fetch_from_warmed_client(self):
+        with Client(api_token=TOKEN, api_root=API_ROOT) as client:
+            client.warm(["/test/acts/47/1", "test/acts/47/1/"])
+            first = client.fetch(query="/test/acts/47/1")
+            second = client.fetch(query="/test/acts/47/1")
+        assert first == second
+        assert first is not second
+        assert first["heading"] == "Short title"
+
+    @pytest.mark.vcr()
+    def test_warm_skips_unavailable_path(self, vcr_cassette):
+        with Client(api_token=TOKEN, api_root=API_ROOT) as client:
+            client.warm(["/us/const/article-III/1", "/test/acts/47/1"])
+            section = client.fetch(query="/test/acts/47/1")
+            assert vcr_cassette.play_count == 2
+            with pytest.raises(LegislicePathError):
+                client.fetch(query="/us/const/article-III/1")
+        assert section["heading"] == "Short title"
+
+    @pytest.mark.vcr()
+    def test_fetch_again_after_clearing_cache(self, vcr_cassette):
+        with Client(api_token=TOKEN, api_root=API_ROOT) as client:
+            client.warm(["/test/acts/47/1"])
+            client.clear_cache()
+            section = client.fetch(query="/test/acts/47/1")
+        assert vcr_cassette.play_count == 2
+        assert section["heading"] == "Short title"
+
+    @pytest.mark.vcr()
+    def test_fetch_batch_requests_each_path_once(self, test_client):
+        sections = test_client.fetch_batch(["/test/acts/47/1", "test/acts/47/1/"])
+        assert len(sections) == 2
+        assert sections[0] == sections[1]
+        assert sections[0] is not sections[1]
+        assert sections[1]["heading"] == "Short title"
+
+    @pytest.mark.vcr()
+    def test_fetch_batch_with_cross_reference(self, test_client, vcr_cassette):
+        reference = CrossReference(
+            target_uri="/test/acts/47/8",
+            target_url="https://authorityspoke.com/api/v1/test/acts/47/8@1935-04-01/",
+            reference_text="section 8",
+        )
+        sections = test_client.fetch_batch(
+            [reference, "/test/acts/47/8"], date=JAN_1_1950
+        )
+        assert vcr_cassette.play_count == 1
+        assert [section["url"] for section in sections] == [
+            "https://authorityspoke.com/api/v1/test/acts/47/8@1950-01-01/",
+            "https://authorityspoke.com/api/v1/test/acts/47/8@1950-01-01/",
+        ]
+
     def test_download_from_wrong_domain_raises_error(self, test_client):
-        url = self.client.url_from_enactment_path("/test/acts/47/1")
+        url = test_client.url_from_enactment_path("/test/acts/47/1")
         wrong_url = url.replace("authorityspoke.com", "pythonforlaw.com")
         with pytest.raises(ValueError):
-            self.client._fetch_from_url(url=wrong_url)
+            test_client._fetch_from_url(url=wrong_url)
 
     @pytest.mark.vcr()
     def test_fetch_current_section_with_date(self, test_client):
-        url = self.client.url_from_enactment_path(
-            "/test/acts/47/6D", date=datetime.date(2020, 1, 1)
-        )
-        response = self.client._fetch_from_url(url=url)
+        url = test_client.url_from_enactment_path("/test/acts/47/6D", date=JAN_1_2020)
+        response = test_client._fetch_from_url(url=url)
 
         # Test that there was no redirect from the API
         assert not response.history
@@ -81,9 +136,7 @@ class TestDownloadJSON:
 
     @pytest.mark.vcr()
     def test_fetch_past_section_with_date(self, test_client):
-        waiver = test_client.fetch(
-            query="/test/acts/47/6D", date=datetime.date(1940, 1, 1)
-        )
+        waiver = test_client.fetch(query="/test/acts/47/6D", date=JAN_1_1940)
         assert waiver["url"].endswith("acts/47/6D@1940-01-01/")
         assert waiver["children"][0]["start_date"] == "1935-04-01"
 
@@ -95,9 +148,7 @@ class TestDownloadJSON:
             target_url="https://authorityspoke.com/api/v1/test/acts/47/8@1935-04-01/",
             reference_text="section 8",
         )
-        enactment = test_client.fetch_cross_reference(
-            query=reference, date=datetime.date(1950, 1, 1)
-        )
+        enactment = test_client.fetch_cross_reference(query=reference, date=JAN_1_1950)
         assert enactment["start_date"] == "1935-04-01"
         assert enactment["url"].endswith("@1950-01-01/")
 
@@ -149,15 +200,13 @@ class TestDownloadAndLoad:
         """
         client = test_client
         with pytest.raises(LegislicePathError):
-            client.read(
-                query="/us/const/amendment/XIV/2/b", date=datetime.date(2010, 12, 15)
-            )
+            client.read(query="/us/const/amendment/XIV/2/b", date=DEC_15_2010)
 
     @pytest.mark.vcr
     def test_date_is_too_early(self, test_client):
         client = test_client
         with pytest.raises(LegislicePathError):
-            client.read(query="/us/usc/t17/s102/a", date=datetime.date(2010, 12, 15))
+            client.read(query="/us/usc/t17/s102/a", date=DEC_15_2010)
 
     @pytest.mark.vcr()
     def test_chapeau_and_subsections_from_uslm_code(self, test_client):
@@ -271,8 +320,6 @@ class TestReadJSON:
 
 
 class TestInboundCitations:
-    client = Client(api_token=TOKEN, api_root=API_ROOT)
-
     @pytest.mark.vcr()
     def test_fetch_inbound_citations_to_node(self, test_client):
         infringement_statute = test_client.read(
@@ -332,13 +379,13 @@ class TestInboundCitations:
                 CitingProvisionLocation(
                     heading="",
                     node="/us/usc/t17/s109/b/4",
-                    start_date=datetime.date(2013, 7, 18),
+                    start_date=JUL_18_2013,
                 )
             ],
         )
         cited = test_client.read(reference)
         assert cited.node == "/us/usc/t17/s109/b/4"
-        assert cited.start_date == datetime.date(2013, 7, 18)
+        assert cited.start_date == JUL_18_2013
         assert repr(reference).startswith("InboundReference(content=")
 
     @pytest.mark.vcr()
@@ -347,20 +394,20 @@ class TestInboundCitations:
         location = CitingProvisionLocation(
             heading="",
             node="/us/usc/t17/s109/b/4",
-            start_date=datetime.date(2013, 7, 18),
+            start_date=JUL_18_2013,
         )
         enactment = test_client.read(location)
         assert enactment.content.startswith("Any person who distributes")
 
     @pytest.mark.vcr()
-    def test_enactment_downloaded_from_citing_location_has_text(self):
+    def test_enactment_downloaded_from_citing_location_has_text(self, test_client):
 
-        inbound_refs = self.client.citations_to("/us/usc/t17/s501")
+        inbound_refs = test_client.citations_to("/us/usc/t17/s501")
         assert str(inbound_refs[0]).startswith("InboundReference to /us/usc/t17/s501")
         assert inbound_refs[0].content.startswith(
             "Any person who distributes a phonorecord"
         )
-        citing_enactment = self.client.read(inbound_refs[0])
+        citing_enactment = test_client.read(inbound_refs[0])
         assert citing_enactment.node == "/us/usc/t17/s109/b/4"
         assert citing_enactment.text.startswith(
             "Any person who distributes a phonorecord"
@@ -1,14 +1,12 @@
 from datetime import date
-import os
+import pickle
 
 from anchorpoint import TextQuoteSelector, TextPositionSelector
 from anchorpoint.textselectors import TextPositionSet, TextSelectionError, Range
-from dotenv import load_dotenv
 from pydantic import ValidationError
 import pytest
 
 from legislice.citations import CodeLevel
-from legislice.download import Client
 from legislice.enactments import (
     CitingProvisionLocation,
     Enactment,
@@ -18,11 +16,6 @@ from legislice.enactments import (
     consolidate_enactments,
 )
 
-load_dotenv()
-
-TOKEN = os.getenv("LEGISLICE_API_TOKEN")
-API_ROOT = "https://authorityspoke.com/api/v1"
-
 
 class TestMakeEnactment:
     def test_init_enactment_without_nesting(self):
@@ -58,6 +51,73 @@ class TestMakeEnactment:
 
         assert section.children[0].content.startswith("The beardcoin shall")
 
+    def test_enactments_share_interned_node(self):
+        first = Enactment(
+            node="".join(["/test/acts/47/", "1"]), start_date=date(1935, 4, 1)
+        )
+        second = Enactment(
+            node="".join(["/test/acts/47/", "1"]), start_date=date(2013, 7, 18)
+        )
+        assert first.node is second.node
+        assert first.code is second.code
+
+    def test_changing_nested_children_list_does_not_change_enactment(
+        self, section_11_subdivided
+    ):
+        enactment = Enactment(**section_11_subdivided)
+        children = enactment.nested_children
+        children.clear()
+        assert len(enactment.nested_children) == len(enactment.children)
+
+    def test_text_of_copy_with_new_children(
+        self, section6c_without_children, section6c_1
+    ):
+        subsection = Enactment(**section6c_1)
+        section = Enactment(**section6c_without_children)
+        assert "cryptocurrency" not in section.text
+        updated = section.copy(update={"children": [subsection]})
+        assert updated.nested_children == [subsection]
+        assert updated.text.endswith("cryptocurrency token…")
+
+    def test_text_sequence_of_copy_with_new_children(
+        self, section6c_without_children, section6c_1
+    ):
+        subsection = Enactment(**section6c_1)
+        section = Enactment(**section6c_without_children)
+        assert len(section.text_sequence()) == 1
+        updated = section.copy(update={"children": [subsection]})
+        assert len(updated.text_sequence()) == 3
+        assert len(section.text_sequence()) == 1
+
+    def test_changing_text_sequence_does_not_change_enactment(
+        self, section_11_subdivided
+    ):
+        enactment = Enactment(**section_11_subdivided)
+        sequence = enactment.text_sequence()
+        sequence.passages.clear()
+        assert str(enactment.text_sequence()).startswith("The Department of Beards")
+        assert enactment.means(Enactment(**section_11_subdivided))
+
+    def test_enactment_is_immutable(self, section_11_subdivided):
+        enactment = Enactment(**section_11_subdivided)
+        with pytest.raises(TypeError):
+            enactment.node = "/test/acts/47/12"
+
+    def test_pickled_enactment_equals_original(self, section_11_subdivided):
+        enactment = Enactment(**section_11_subdivided)
+        hash(enactment)
+        unpickled = pickle.loads(pickle.dumps(enactment))
+        assert unpickled._hash is None
+        hash(unpickled)
+        assert unpickled == enactment
+        assert unpickled in {enactment}
+
+    def test_passage_shares_enactment(self, section_11_subdivided):
+        enactment = Enactment(**section_11_subdivided)
+        passage = enactment.select("hairdressers")
+        assert passage.enactment is enactment
+        assert passage.enactment.nested_children[0] is enactment.children[0]
+
     def test_create_TextPositionSet_on_init(self, section_11_subdivided):
         len_s11 = len(section_11_subdivided["text_version"]["content"])
         data = {
@@ -97,7 +157,7 @@ class TestLinkedEnactment:
             text_version="Do unto others as you would have them do to you.",
             start_date=date(1, 1, 1),
         )
-        assert enactment.children == []
+        assert enactment.children == ()
         new = enactment.select("Do unto others")
         assert new.selected_text() == "Do unto others…"
 
@@ -145,6 +205,20 @@ class TestEnactmentDetails:
         assert passage.jurisdiction == "test"
         assert passage.sovereign == "test"
 
+    def test_node_parts_of_copy_with_new_node(self, section_11_subdivided):
+        enactment = Enactment(**section_11_subdivided)
+        assert enactment.section == "11"
+        updated = enactment.copy(update={"node": "/us/usc/t17/s103"})
+        assert updated.section == "s103"
+        assert updated.level == CodeLevel.STATUTE
+
+    def test_locate_descendant(self, section_8):
+        enactment = Enactment(**section_8)
+        descendant, offset = enactment.locate_descendant("/test/acts/47/8/2/b")
+        assert descendant.node == "/test/acts/47/8/2/b"
+        assert enactment.text[offset:].startswith(descendant.text)
+        assert enactment.locate_descendant("/test/acts/47/8/3") is None
+
     def test_csl_json_fields(self, test_client, section_11_subdivided):
         section = test_client.read_from_json(section_11_subdivided)
         cite_json = section.csl_json()
@@ -204,6 +278,27 @@ class TestEnactmentDetails:
         )
         assert inbound_ref.latest_location().node == "/test/acts/47/7"
 
+    def test_deduplicate_citing_locations_in_set(self):
+        locations = {
+            CitingProvisionLocation(
+                node="/test/acts/47/7", start_date=date(2000, 2, 2)
+            ),
+            CitingProvisionLocation(
+                node="/test/acts/47/7", start_date=date(2000, 2, 2)
+            ),
+            CitingProvisionLocation(
+                node="/test/acts/47/8", start_date=date(2000, 2, 2)
+            ),
+        }
+        assert len(locations) == 2
+
+    def test_equal_enactments_have_same_hash(self, section_11_subdivided):
+        enactment = Enactment(**section_11_subdivided)
+        same = Enactment(**section_11_subdivided)
+        assert enactment == same
+        assert hash(enactment) == hash(same)
+        assert enactment != enactment.copy(update={"heading": "Changed heading"})
+
 
 class TestCrossReferences:
     @pytest.mark.vcr()
@@ -223,6 +318,48 @@ class TestCrossReferences:
             == 'CrossReference(target_uri="/test/acts/47/6C", reference_text="Section 6C")'
         )
 
+    def test_cross_references_in_text_order(self):
+        def cite(section: str) -> dict:
+            return {
+                "target_uri": f"/test/acts/47/{section}",
+                "target_url": f"https://authorityspoke.com/api/v1/test/acts/47/{section}/",
+                "reference_text": f"Section {section}",
+            }
+
+        enactment = Enactment(
+            node="/test/acts/47/12",
+            start_date=date(1935, 4, 1),
+            text_version="Section 1 and Section 2 apply.",
+            citations=[cite("1")],
+            children=[
+                Enactment(
+                    node="/test/acts/47/12/a",
+                    start_date=date(1935, 4, 1),
+                    citations=[cite("2")],
+                    children=[
+                        Enactment(
+                            node="/test/acts/47/12/a/i",
+                            start_date=date(1935, 4, 1),
+                            citations=[cite("3")],
+                        )
+                    ],
+                ),
+                Enactment(
+                    node="/test/acts/47/12/b",
+                    start_date=date(1935, 4, 1),
+                    citations=[cite("4")],
+                ),
+            ],
+        )
+        references = enactment.cross_references()
+        assert [ref.reference_text for ref in references] == [
+            "Section 1",
+            "Section 2",
+            "Section 3",
+            "Section 4",
+        ]
+        assert list(enactment.iter_cross_references()) == references
+
     @pytest.mark.vcr()
     def test_locations_of_cross_reference(self, test_client):
         enactment = test_client.read("/test/acts/47/6D")
@@ -233,8 +370,6 @@ class TestCrossReferences:
 
 
 class TestSelectText:
-    client = Client(api_token=TOKEN)
-
     def test_same_quotation_from_enactments_of_differing_depths(
         self, test_client, section_11_subdivided
     ):
@@ -331,8 +466,6 @@ class TestSelectText:
 
 
 class TestSelectFromEnactment:
-    client = Client(api_token=TOKEN)
-
     def test_text_of_enactment_subset(self, section_11_together):
         combined = Enactment(**section_11_together)
         selector = TextQuoteSelector(
@@ -471,6 +604,19 @@ class TestSelectFromEnactment:
             ],
         )
 
+    def test_quote_positions_same_for_equivalent_quotes(self, section_11_subdivided):
+        section = Enactment(**section_11_subdivided)
+        quote = TextQuoteSelector(
+            exact="hairdressers", suffix=", or other male grooming"
+        )
+        first = section.convert_selection_to_set(quote)
+        second = section.convert_selection_to_set(
+            TextQuoteSelector(exact="hairdressers", suffix=", or other male grooming")
+        )
+        assert first == second
+        with pytest.raises(TextSelectionError):
+            section.convert_selection_to_set("beard wax")
+
     @pytest.mark.vcr
     def test_text_sequence_has_no_consecutive_Nones(self, test_client):
 
@@ -496,8 +642,8 @@ class TestSelectFromEnactment:
         with pytest.raises(TextSelectionError):
             enactment.select(selector)
 
-    def test_select_text_with_string(self, fourth_a):
-        section = Enactment(**fourth_a)
+    def test_select_text_with_string(self, fourth_a_enactment):
+        section = fourth_a_enactment
         passage = section.select("The right of the people")
         assert passage.selected_text() == "The right of the people…"
 
@@ -518,8 +664,8 @@ class TestSelectFromEnactment:
         assert " …" not in passage.selected_text()
 
     @pytest.mark.vcr
-    def test_select_near_end_of_section(self):
-        amendment = self.client.read(query="/us/const/amendment/XIV")
+    def test_select_near_end_of_section(self, test_client):
+        amendment = test_client.read(query="/us/const/amendment/XIV")
         selector = TextPositionSelector(start=1920, end=1980)
         passage = amendment.select(selector)
         assert "The validity of the public debt" in passage.selected_text()
@@ -544,9 +690,9 @@ class TestCompareEnactment:
         assert old_version.means(new_version)
 
     @pytest.mark.vcr
-    def test_unequal_enactment_text(self, fourth_a):
+    def test_unequal_enactment_text(self, fourth_a_enactment):
 
-        enactment = Enactment(**fourth_a)
+        enactment = fourth_a_enactment
         selector = TextQuoteSelector(suffix=", and no Warrants")
         search_clause = enactment.select(selector)
 
@@ -636,6 +782,27 @@ class TestCompareEnactment:
         assert not passage.means(limited)
         assert combined > limited
 
+    def test_implication_from_positions_in_same_enactment(self, section_8):
+        enactment = Enactment(**section_8)
+        broad = enactment.select(
+            TextPositionSet(
+                positions=[
+                    TextPositionSelector(start=0, end=100),
+                    TextPositionSelector(start=432, end=None),
+                ]
+            )
+        )
+        narrow = enactment.select(
+            TextPositionSet(
+                positions=[
+                    TextPositionSelector(start=10, end=50),
+                    TextPositionSelector(start=506, end=576),
+                ]
+            )
+        )
+        assert broad.implies(narrow)
+        assert not narrow.implies(broad)
+
     def test_cannot_compare_passage_with_text_version(self, section_8):
         enactment = Enactment(**section_8)
         passage = enactment.select_all()
@@ -752,8 +919,8 @@ class TestAddEnactments:
         assert "Any such person" in selected_text
         assert "must…shave" in selected_text
 
-    def test_add_shorter_plus_longer(self, fourth_a):
-        fourth_a = Enactment(**fourth_a)
+    def test_add_shorter_plus_longer(self, fourth_a_enactment):
+        fourth_a = fourth_a_enactment
         selector = TextQuoteSelector(suffix=", and no Warrants")
         amendment = fourth_a.select_all()
         search_clause = fourth_a.select(selector)
@@ -767,8 +934,8 @@ class TestAddEnactments:
         assert lesser_plus_greater.text == amendment.text
         assert lesser_plus_greater.means(amendment)
 
-    def test_add_overlapping_text_selection(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_add_overlapping_text_selection(self, fourth_a_enactment):
+        enactment = fourth_a_enactment
         passage = enactment.select(TextQuoteSelector(suffix=", and no Warrants"))
         new = enactment.make_selection(
             TextQuoteSelector(
@@ -784,8 +951,8 @@ class TestAddEnactments:
         )
         assert expected in passage.selected_text()
 
-    def test_non_overlapping_text_selection(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_non_overlapping_text_selection(self, fourth_a_enactment):
+        enactment = fourth_a_enactment
         left = enactment.select("The right of the people to be secure in their persons")
         right = enactment.select("shall not be violated")
         left.select_more_text_at_current_node(right.selection)
@@ -794,8 +961,8 @@ class TestAddEnactments:
             "shall not be violated…"
         )
 
-    def test_limit_selected_text(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_limit_selected_text(self, fourth_a_enactment):
+        enactment = fourth_a_enactment
         passage = enactment.select(
             "The right of the people to be secure in their persons"
         )
@@ -807,15 +974,15 @@ class TestAddEnactments:
         passage.limit_selection(start=40)
         assert passage.selected_text() == "…their persons…shall not be violated…"
 
-    def test_change_selection_to_all(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_change_selection_to_all(self, fourth_a_enactment):
+        enactment = fourth_a_enactment
         passage = enactment.select("right of the people")
         assert passage.selected_text() == ("…right of the people…")
         passage.select_all()
         assert passage.selected_text().startswith("The right of the people to")
 
-    def test_select_unavailable_text(self, fourth_a):
-        fourth = Enactment(**fourth_a)
+    def test_select_unavailable_text(self, fourth_a_enactment):
+        fourth = fourth_a_enactment
         with pytest.raises(TextSelectionError):
             fourth.select("right to privacy")
 
@@ -843,8 +1010,8 @@ class TestAddEnactments:
         # Test that original Enactments unchanged
         assert "obtain a beardcoin" not in new_selection.selected_text()
 
-    def test_add_overlapping_enactments(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_add_overlapping_enactments(self, fourth_a_enactment):
+        enactment = fourth_a_enactment
         search = enactment.select(TextQuoteSelector(suffix=", and no Warrants"))
         warrant = enactment.select(
             TextQuoteSelector(
@@ -1029,13 +1196,13 @@ class TestAddEnactments:
     def test_repealed_passage_end_date_is_earliest_found(
         self, old_section_8, test_client
     ):
+        # adding an earlier end date
+        old_section_8["children"][1]["children"][2]["end_date"] = date(2001, 1, 1)
         old_version = test_client.read_from_json(old_section_8)
         old_passage = old_version.select(
             TextQuoteSelector(prefix="officer of the ", exact="Department of Beards")
         )
         old_passage.select_more("obtain a beardcoin from the Department of Beards")
-        # adding an earlier end date
-        old_passage.enactment.children[1].children[2].end_date = date(2001, 1, 1)
         old_passage.select_more("within 14 days of such notice")
         assert old_passage.start_date == date(1935, 4, 1)
         assert old_passage.end_date == date(2001, 1, 1)
@@ -1083,8 +1250,8 @@ class TestAddEnactments:
 class TestConsolidateEnactments:
     """Test function for combining a list of Enactments."""
 
-    def test_consolidate_enactments(self, fourth_a):
-        enactment = Enactment(**fourth_a)
+    def test_consolidate_enactments(self, fourth_a_enactment):
+        enactment = fourth_a_enactment
         search_selector = TextQuoteSelector(suffix=", and no Warrants")
         search_clause = enactment.select(search_selector)
 
@@ -1127,6 +1294,19 @@ class TestConsolidateEnactments:
             for law in combined
         )
 
+    def test_consolidate_passage_with_passage_from_child_node(
+        self, fifth_a, section_11_subdivided
+    ):
+        section = Enactment(**section_11_subdivided)
+        subsection = section.nested_children[1].select_all()
+        other_section = Enactment(**fifth_a).select("life, liberty, or property")
+
+        combined = consolidate_enactments(
+            [subsection, other_section, section.select_all()]
+        )
+        assert len(combined) == 2
+        assert any(passage.node == section.node for passage in combined)
+
     def test_do_not_consolidate_from_different_sections(self, fifth_a, fourteenth_dp):
 
         due_process_5 = Enactment(**fifth_a)
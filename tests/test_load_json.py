@@ -4,6 +4,8 @@ from anchorpoint import TextQuoteSelector
 import pytest
 from legislice.download import Client
 
+from ._env import TOKEN
+
 
 class TestUpdateEnactments:
     """
@@ -33,6 +35,50 @@ class TestUpdateEnactments:
         assert updated_enactment["enactment"]["heading"] == "AMENDMENT IV."
         assert updated_enactment["enactment"]["url"].startswith("https")
 
+    @pytest.mark.vcr
+    def test_update_entries_for_same_provision(self, test_client, vcr_cassette):
+        enactment_index = {
+            "security": {
+                "enactment": {
+                    "node": "/us/const/amendment/IV",
+                    "start_date": "1791-12-15",
+                },
+            },
+            "warrants": {
+                "enactment": {
+                    "node": "/us/const/amendment/IV",
+                    "start_date": date(1791, 12, 15),
+                },
+            },
+        }
+        updated_index = test_client.update_entries_in_enactment_index(enactment_index)
+        assert vcr_cassette.play_count == 1
+        assert updated_index["warrants"]["enactment"]["heading"] == "AMENDMENT IV."
+        security = updated_index["security"]["enactment"]
+        warrants = updated_index["warrants"]["enactment"]
+        assert security == warrants
+        assert security["text_version"] is not warrants["text_version"]
+
+    @pytest.mark.vcr
+    def test_update_entries_with_overridden_update_method(self):
+        class LabelingClient(Client):
+            def update_enactment_from_api(self, data):
+                return {**super().update_enactment_from_api(data), "name": "updated"}
+
+        enactment_index = {
+            label: {
+                "enactment": {
+                    "node": "/us/const/amendment/IV",
+                    "start_date": "1791-12-15",
+                },
+            }
+            for label in ("security", "warrants")
+        }
+        with LabelingClient(api_token=TOKEN) as client:
+            updated_index = client.update_entries_in_enactment_index(enactment_index)
+        assert updated_index["security"]["enactment"]["name"] == "updated"
+        assert updated_index["warrants"]["enactment"]["name"] == "updated"
+
     @pytest.mark.vcr
     def test_update_entry_without_date(self, test_client):
         enactment_index = {